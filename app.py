@@ -2,505 +2,365 @@
 """
 Generador de texturas completo para el Ray Tracer
 Crea texturas 16x16 en PNG (estáticas y animadas)
-Requiere: pip install pillow
+Requiere: pip install pillow numpy
 """
 
 from PIL import Image, ImageDraw, ImageFilter
+import numpy as np
+import argparse
+import json
 import os
-import random
-import math
+import struct
+import zlib
+
+# Kernels compilados con Numba: solo con TEXTURES_NUMBA=1 (ver kernels.py), ya que
+# importar Numba cuesta más que generar todas las texturas con NumPy
+kernels = None
+if os.environ.get("TEXTURES_NUMBA") == "1":
+    try:
+        import kernels
+    except ImportError:
+        print("Numba no está instalado, se usa la versión NumPy")
+
+# Opciones de guardado PNG: en imágenes de 16x16 el nivel 1 de zlib da casi
+# el mismo tamaño que el nivel 6 por defecto con mucho menos trabajo
+# (se usa tanto en el escritor propio como en el respaldo con Pillow)
+PNG_OPTS = {"compress_level": 1}
+
+# Generador aleatorio (PCG64) para todo el ruido vectorizado
+RNG = np.random.default_rng()
+
+# Tabla de saturación: CLIP_LUT[v + 256] == clamp(v, 0, 255) para v en [-256, 511]
+CLIP_LUT = np.arange(-256, 512).clip(0, 255).astype(np.uint8)
+
+# Texturas por fila del atlas (--atlas): 6 columnas x 5 filas = 96x80 píxeles
+ATLAS_COLUMNS = 6
+
+# Geometría fija de las texturas 16x16, calculada una sola vez al importar
+YY, XX = np.mgrid[:16, :16]
+DX = XX - 8.0
+DY = YY - 8.0
+DIST = np.hypot(DX, DY)
+ANGLE = np.arctan2(DY, DX)
+RING = (DIST * 2).astype(np.int32) & 1
+FACET = ((np.abs(XX - 8) + np.abs(YY - 8)) * 2) % 3
+# Mortero de ladrillos: filas alternas desplazadas media pieza
+BRICK_MORTAR = ((XX + (YY // 4) % 2 * 4) % 8 == 0) | (YY % 4 == 0)
+NETHER_MORTAR = (XX % 8 == 0) | (YY % 8 == 0)
 
 def ensure_directory():
     """Crea el directorio de texturas si no existe"""
     os.makedirs("assets/textures", exist_ok=True)
     print("Directorio assets/textures/ creado/verificado")
 
-def add_noise(color, amount=10):
-    """Añade ruido aleatorio a un color"""
-    r, g, b = color
-    noise = random.randint(-amount, amount)
-    return (
-        max(0, min(255, r + noise)),
-        max(0, min(255, g + noise)),
-        max(0, min(255, b + noise))
-    )
+def noise_field(amount, shape=(16, 16)):
+    """Ruido entero uniforme en [-amount, amount], un valor por píxel"""
+    return RNG.integers(-amount, amount + 1, shape, dtype=np.int16)
+
+def add_noise(base_color, amount=10, shape=(16, 16)):
+    """Crea un arreglo (alto, ancho, 3) uint8 del color base con ruido por píxel"""
+    # El mismo ruido para los tres canales de cada píxel
+    noise = noise_field(amount, shape)
+    if kernels is not None:
+        out = np.empty(shape + (3,), dtype=np.uint8)
+        kernels.fill_noise(out, np.array(base_color, dtype=np.int16), noise)
+        return out
+    return CLIP_LUT[np.array(base_color, dtype=np.int16) + noise[..., None] + 256]
+
+def shift(arr, mask, delta):
+    """Aclara u oscurece (con saturación) los píxeles de la máscara; delta es un entero o (r, g, b)"""
+    arr[mask] = CLIP_LUT[arr[mask].astype(np.int16) + np.add(delta, 256)]
+
+def png_chunk(tag, data):
+    """Empaqueta un chunk PNG: longitud, tipo, datos y CRC"""
+    return struct.pack('>I', len(data)) + tag + data + struct.pack('>I', zlib.crc32(tag + data))
+
+def save_texture(arr, path):
+    """Guarda un arreglo (alto, ancho, 3) uint8 como PNG RGB"""
+    if arr.ndim != 3 or arr.shape[2] != 3 or arr.dtype != np.uint8:
+        # Formato poco común: que Pillow se encargue
+        Image.fromarray(arr).save(path, **PNG_OPTS)
+        return
+    
+    # Escritura directa con zlib: firma + IHDR + un único IDAT + IEND
+    height, width = arr.shape[:2]
+    rows = np.zeros((height, 1 + width * 3), dtype=np.uint8)  # byte de filtro 0 por fila
+    rows[:, 1:] = arr.reshape(height, width * 3)
+    header = struct.pack('>IIBBBBB', width, height, 8, 2, 0, 0, 0)  # 8 bits, RGB
+    with open(path, 'wb') as f:
+        f.write(b'\x89PNG\r\n\x1a\n')
+        f.write(png_chunk(b'IHDR', header))
+        f.write(png_chunk(b'IDAT', zlib.compress(rows.tobytes(), PNG_OPTS["compress_level"])))
+        f.write(png_chunk(b'IEND', b''))
+
+def save_atlas(textures, path="assets/atlas.png"):
+    """Empaqueta todas las texturas 16x16 en un atlas PNG con un manifiesto JSON al lado"""
+    rows = -(-len(textures) // ATLAS_COLUMNS)
+    atlas = np.zeros((rows * 16, ATLAS_COLUMNS * 16, 3), dtype=np.uint8)
+    manifest = {}
+    
+    for index, (texture_path, arr) in enumerate(textures):
+        x = index % ATLAS_COLUMNS * 16
+        y = index // ATLAS_COLUMNS * 16
+        atlas[y:y + 16, x:x + 16] = arr
+        # Nombre igual al que usa el cargador de Rust: archivo sin extensión
+        name = os.path.splitext(os.path.basename(texture_path))[0]
+        manifest[name] = [x, y, 16, 16]
+    
+    save_texture(atlas, path)
+    with open(os.path.splitext(path)[0] + ".json", "w") as f:
+        json.dump(manifest, f, indent=2)
 
 def generate_grass_top():
     """Genera textura de césped (vista superior)"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (50, 180, 50)
-    
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 20)
-            # Añadir algunos píxeles más oscuros para variación
-            if random.random() < 0.15:
-                color = tuple(max(0, c - 30) for c in color)
-            pixels[x, y] = color
+    arr = add_noise((50, 180, 50), 20)
+    # Añadir algunos píxeles más oscuros para variación
+    shift(arr, RNG.random((16, 16)) < 0.15, -30)
     
-    img.save("assets/textures/grass_top.png")
-    print("grass_top.png")
+    return [("assets/textures/grass_top.png", arr)]
 
 def generate_grass_side():
     """Genera textura de césped lateral (con tierra abajo)"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
     grass_color = (50, 180, 50)
     dirt_color = (130, 80, 40)
     
-    for y in range(size):
-        for x in range(size):
-            if y < 4:  # Top 25% is grass
-                color = add_noise(grass_color, 15)
-            else:  # Bottom 75% is dirt
-                color = add_noise(dirt_color, 20)
-            pixels[x, y] = color
+    # Top 25% is grass, bottom 75% is dirt
+    arr = np.concatenate([add_noise(grass_color, 15, (4, 16)), add_noise(dirt_color, 20, (12, 16))])
     
-    img.save("assets/textures/grass_side.png")
-    print("grass_side.png")
+    return [("assets/textures/grass_side.png", arr)]
 
 def generate_dirt():
     """Genera textura de tierra"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (130, 80, 40)
+    arr = add_noise((130, 80, 40), 25)
+    # Añadir pequeñas piedras ocasionales
+    arr[RNG.random((16, 16)) < 0.05] = (90, 90, 90)
     
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 25)
-            # Añadir pequeñas piedras ocasionales
-            if random.random() < 0.05:
-                color = (90, 90, 90)
-            pixels[x, y] = color
-    
-    img.save("assets/textures/dirt.png")
-    print("dirt.png")
+    return [("assets/textures/dirt.png", arr)]
 
 def generate_stone():
     """Genera textura de piedra"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (100, 100, 100)
-    
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 30)
-            
-            # Grietas y variación
-            if random.random() < 0.1:
-                color = tuple(max(0, c - 40) for c in color)
-            elif random.random() < 0.05:
-                color = tuple(min(255, c + 20) for c in color)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/stone.png")
-    print("stone.png")
+    arr = add_noise((100, 100, 100), 30)
+    
+    # Grietas y variación
+    cracks = RNG.random((16, 16)) < 0.1
+    shift(arr, cracks, -40)
+    shift(arr, ~cracks & (RNG.random((16, 16)) < 0.05), 20)
+    
+    return [("assets/textures/stone.png", arr)]
 
 def generate_wood():
     """Genera textura de madera con anillos"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
     base_color = (80, 50, 20)
-    center = size // 2
-    
-    for y in range(size):
-        for x in range(size):
-            # Distancia al centro para anillos
-            dist = math.sqrt((x - center)**2 + (y - center)**2)
-            ring = int(dist * 2) % 2
-            
-            if ring == 0:
-                color = add_noise(base_color, 10)
-            else:
-                darker = tuple(max(0, c - 15) for c in base_color)
-                color = add_noise(darker, 10)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/wood.png")
-    print("wood.png")
+    darker = tuple(max(0, c - 15) for c in base_color)
+    
+    if kernels is not None:
+        arr = np.empty((16, 16, 3), dtype=np.uint8)
+        kernels.fill_select(arr, RING == 1, np.array(darker, dtype=np.int16),
+                            np.array(base_color, dtype=np.int16),
+                            noise_field(10), noise_field(10))
+    else:
+        arr = np.where(RING[..., None] == 0, add_noise(base_color, 10), add_noise(darker, 10))
+    
+    return [("assets/textures/wood.png", arr)]
 
 def generate_leaves():
     """Genera textura de hojas"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (40, 120, 40)
-    
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 35)
-            
-            # Sombras y luces
-            if random.random() < 0.15:
-                color = tuple(max(0, c - 25) for c in color)
-            elif random.random() < 0.1:
-                color = tuple(min(255, c + 30) for c in color)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/leaves.png")
-    print("leaves.png")
+    arr = add_noise((40, 120, 40), 35)
+    
+    # Sombras y luces
+    shadow = RNG.random((16, 16)) < 0.15
+    light = ~shadow & (RNG.random((16, 16)) < 0.1)
+    shift(arr, shadow, -25)
+    shift(arr, light, 30)
+    
+    return [("assets/textures/leaves.png", arr)]
 
 def generate_water_animated():
     """Genera 4 frames de agua animada"""
-    size = 16
-    
-    for frame in range(4):
-        img = Image.new('RGB', (size, size))
-        pixels = img.load()
-        
-        base_color = (30, 80, 200)
-        offset = frame * 2
-        
-        for y in range(size):
-            for x in range(size):
-                # Patrón de olas animado
-                wave = ((x + offset + y) % 4) * 8
-                color = (
-                    min(255, base_color[0] + wave),
-                    min(255, base_color[1] + wave),
-                    min(255, base_color[2] + wave)
-                )
-                pixels[x, y] = color
-        
-        img.save(f"assets/textures/water_{frame}.png")
-    
-    print("water_0.png, water_1.png, water_2.png, water_3.png")
+    base_color = np.array((30, 80, 200), dtype=np.int16)
+    
+    if kernels is not None:
+        frames = np.empty((4, 16, 16, 3), dtype=np.uint8)
+        kernels.fill_water(frames, base_color)
+    else:
+        # Patrón de olas animado para los 4 frames a la vez: (frame, y, x)
+        frame = np.arange(4)[:, None, None]
+        wave = ((XX + frame * 2 + YY) % 4) * 8
+        frames = np.minimum(255, base_color + wave[..., None]).astype(np.uint8)
+    
+    return [(f"assets/textures/water_{i}.png", frames[i]) for i in range(4)]
 
 def generate_lava_animated():
     """Genera 4 frames de lava animada"""
-    size = 16
-    
-    for frame in range(4):
-        img = Image.new('RGB', (size, size))
-        pixels = img.load()
-        
-        offset = frame * 3
-        
-        for y in range(size):
-            for x in range(size):
-                # Flujo de lava animado
-                flow = ((x * 3 + y * 7 + offset) % 12) / 12.0
-                
-                if flow < 0.3:
-                    color = (255, 100 + int(flow * 200), int(flow * 50))
-                elif flow < 0.7:
-                    color = (255, 180 - int(flow * 100), 0)
-                else:
-                    color = (200 + int(flow * 55), 80, 0)
-                
-                # Burbujas ocasionales
-                if random.random() < 0.05:
-                    color = (255, 200, 50)
-                
-                pixels[x, y] = color
-        
-        img.save(f"assets/textures/lava_{frame}.png")
-    
-    print("lava_0.png, lava_1.png, lava_2.png, lava_3.png")
+    # Flujo de lava animado para los 4 frames a la vez: (frame, y, x)
+    frame = np.arange(4)[:, None, None]
+    flow = ((XX * 3 + YY * 7 + frame * 3) % 12) / 12.0
+    
+    low = flow < 0.3
+    mid = ~low & (flow < 0.7)
+    r = np.where(low | mid, 255, 200 + (flow * 55).astype(np.int32))
+    g = np.where(low, 100 + (flow * 200).astype(np.int32),
+                 np.where(mid, 180 - (flow * 100).astype(np.int32), 80))
+    b = np.where(low, (flow * 50).astype(np.int32), 0)
+    frames = np.stack([r, g, b], axis=-1).astype(np.uint8)
+    
+    # Burbujas ocasionales
+    frames[RNG.random((4, 16, 16)) < 0.05] = (255, 200, 50)
+    
+    return [(f"assets/textures/lava_{i}.png", frames[i]) for i in range(4)]
 
 def generate_portal_animated():
     """Genera 6 frames de portal animado"""
-    size = 16
-    
-    for frame in range(6):
-        img = Image.new('RGB', (size, size))
-        pixels = img.load()
-        
-        phase = frame * math.pi / 3
-        center = size / 2
-        
-        for y in range(size):
-            for x in range(size):
-                # Distancia al centro
-                dx = x - center
-                dy = y - center
-                dist = math.sqrt(dx**2 + dy**2)
-                angle = math.atan2(dy, dx)
-                
-                # Espiral psicodélica
-                wave = math.sin(dist * 0.8 + phase) * 50
-                swirl = math.sin(angle * 3 + phase) * 30
-                
-                purple = int(128 + wave + swirl)
-                magenta = int(0 + wave / 3 + swirl / 2)
-                violet = int(200 + wave + swirl)
-                
-                color = (
-                    max(80, min(220, purple)),
-                    max(0, min(120, magenta)),
-                    max(150, min(255, violet))
-                )
-                
-                pixels[x, y] = color
-        
-        img.save(f"assets/textures/portal_{frame}.png")
-    
-    print("portal_0.png ... portal_5.png")
+    # Espiral psicodélica para los 6 frames a la vez: (frame, y, x)
+    phase = np.arange(6)[:, None, None] * np.pi / 3
+    wave = np.sin(DIST * 0.8 + phase) * 50
+    swirl = np.sin(ANGLE * 3 + phase) * 30
+    
+    # Morado, magenta y violeta, cada canal recortado a su propio rango
+    channels = np.stack([128 + wave + swirl, wave / 3 + swirl / 2, 200 + wave + swirl], axis=-1)
+    frames = np.clip(channels.astype(np.int32), (80, 0, 150), (220, 120, 255)).astype(np.uint8)
+    
+    return [(f"assets/textures/portal_{i}.png", frames[i]) for i in range(6)]
 
 def generate_netherrack():
     """Genera textura de netherrack"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
+    arr = add_noise((150, 50, 50), 40)
     
-    base_color = (150, 50, 50)
+    # Vetas más oscuras
+    shift(arr, (XX + YY * 3) % 7 == 0, -30)
     
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 40)
-            
-            # Vetas más oscuras
-            if (x + y * 3) % 7 == 0:
-                color = tuple(max(0, c - 30) for c in color)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/netherrack.png")
-    print("netherrack.png")
+    return [("assets/textures/netherrack.png", arr)]
 
 def generate_nether_brick():
     """Genera textura de ladrillos del Nether"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
     brick_color = (50, 15, 15)
     mortar_color = (20, 10, 10)
     
-    for y in range(size):
-        for x in range(size):
-            if x % 8 == 0 or y % 8 == 0:
-                pixels[x, y] = add_noise(mortar_color, 5)
-            else:
-                pixels[x, y] = add_noise(brick_color, 10)
+    arr = np.where(NETHER_MORTAR[..., None], add_noise(mortar_color, 5), add_noise(brick_color, 10))
     
-    img.save("assets/textures/nether_brick.png")
-    print("nether_brick.png")
+    return [("assets/textures/nether_brick.png", arr)]
 
 def generate_soul_sand():
     """Genera textura de arena de almas"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (70, 50, 35)
+    arr = add_noise((70, 50, 35), 20)
+    # "Caras" de almas ocasionales
+    shift(arr, RNG.random((16, 16)) < 0.08, -35)
     
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 20)
-            
-            # "Caras" de almas ocasionales
-            if random.random() < 0.08:
-                color = tuple(max(0, c - 35) for c in color)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/soul_sand.png")
-    print("soul_sand.png")
+    return [("assets/textures/soul_sand.png", arr)]
 
 def generate_glowstone():
     """Genera textura de piedra luminosa"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (255, 220, 100)
-    
-    for y in range(size):
-        for x in range(size):
-            brightness = random.randint(-20, 20)
-            
-            # Cristales más brillantes
-            if ((x + y) % 3) == 0:
-                brightness += 20
-            
-            color = (
-                min(255, base_color[0] + brightness),
-                min(255, base_color[1] + brightness),
-                min(255, max(0, base_color[2] + brightness))
-            )
-            pixels[x, y] = color
-    
-    img.save("assets/textures/glowstone.png")
-    print("glowstone.png")
+    arr = add_noise((255, 220, 100), 20)
+    # Cristales más brillantes
+    shift(arr, (XX + YY) % 3 == 0, 20)
+    
+    return [("assets/textures/glowstone.png", arr)]
 
 def generate_diamond():
     """Genera textura de diamante cristalino"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (180, 230, 255)
-    center = size / 2
-    
-    for y in range(size):
-        for x in range(size):
-            # Facetas del cristal
-            dx = abs(x - center)
-            dy = abs(y - center)
-            facet = int((dx + dy) * 2) % 3
-            
-            color = add_noise(base_color, 20)
-            
-            # Brillo en ciertas facetas
-            if facet == 0:
-                color = tuple(min(255, c + 30) for c in color)
-            elif facet == 2:
-                color = tuple(max(0, c - 20) for c in color)
-            
-            # Destellos
-            if random.random() < 0.05:
-                color = (255, 255, 255)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/diamond.png")
-    print("diamond.png")
+    arr = add_noise((180, 230, 255), 20)
+    
+    # Facetas del cristal con brillo en algunas de ellas
+    shift(arr, FACET == 0, 30)
+    shift(arr, FACET == 2, -20)
+    
+    # Destellos
+    arr[RNG.random((16, 16)) < 0.05] = (255, 255, 255)
+    
+    return [("assets/textures/diamond.png", arr)]
 
 def generate_emerald():
     """Genera textura de esmeralda"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (50, 230, 80)
-    center = size / 2
-    
-    for y in range(size):
-        for x in range(size):
-            # Facetas hexagonales
-            dx = abs(x - center)
-            dy = abs(y - center)
-            facet = int((dx + dy) * 2) % 3
-            
-            color = add_noise(base_color, 25)
-            
-            if facet == 0:
-                color = tuple(min(255, c + 40) for c in color)
-            elif facet == 2:
-                color = tuple(max(0, c - 25) for c in color)
-            
-            # Destellos verdes
-            if random.random() < 0.03:
-                color = (150, 255, 180)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/emerald.png")
-    print("emerald.png")
+    arr = add_noise((50, 230, 80), 25)
+    
+    # Facetas hexagonales
+    shift(arr, FACET == 0, 40)
+    shift(arr, FACET == 2, -25)
+    
+    # Destellos verdes
+    arr[RNG.random((16, 16)) < 0.03] = (150, 255, 180)
+    
+    return [("assets/textures/emerald.png", arr)]
 
 def generate_obsidian():
     """Genera textura de obsidiana"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (10, 5, 25)
-    
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 15)
-            
-            # Vetas moradas ocasionales
-            if random.random() < 0.08:
-                color = (
-                    color[0] + 15,
-                    color[1],
-                    min(255, color[2] + 40)
-                )
-            
-            # Reflejos sutiles
-            if random.random() < 0.05:
-                color = tuple(min(255, c + 50) for c in color)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/obsidian.png")
-    print("obsidian.png")
+    arr = add_noise((10, 5, 25), 15)
+    
+    # Vetas moradas ocasionales y reflejos sutiles
+    shift(arr, RNG.random((16, 16)) < 0.08, (15, 0, 40))
+    shift(arr, RNG.random((16, 16)) < 0.05, 50)
+    
+    return [("assets/textures/obsidian.png", arr)]
 
 def generate_ice():
     """Genera textura de hielo"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (200, 230, 255)
-    
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 15)
-            
-            # Grietas de hielo
-            if (x + y) % 7 == 0 or (x - y) % 9 == 0:
-                color = tuple(max(0, c - 40) for c in color)
-            
-            # Brillo cristalino
-            if ((x * y) % 5) == 0:
-                color = tuple(min(255, c + 20) for c in color)
-            
-            pixels[x, y] = color
-    
-    img.save("assets/textures/ice.png")
-    print("ice.png")
+    arr = add_noise((200, 230, 255), 15)
+    
+    # Grietas de hielo y brillo cristalino
+    shift(arr, ((XX + YY) % 7 == 0) | ((XX - YY) % 9 == 0), -40)
+    shift(arr, (XX * YY) % 5 == 0, 20)
+    
+    return [("assets/textures/ice.png", arr)]
 
 def generate_brick():
     """Genera textura de ladrillos normales"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
     brick_color = (150, 80, 60)
     mortar_color = (180, 180, 180)
     
-    for y in range(size):
-        for x in range(size):
-            offset = (y // 4) % 2 * 4
-            if (x + offset) % 8 == 0 or y % 4 == 0:
-                pixels[x, y] = add_noise(mortar_color, 10)
-            else:
-                pixels[x, y] = add_noise(brick_color, 15)
+    if kernels is not None:
+        arr = np.empty((16, 16, 3), dtype=np.uint8)
+        kernels.fill_select(arr, BRICK_MORTAR, np.array(mortar_color, dtype=np.int16),
+                            np.array(brick_color, dtype=np.int16),
+                            noise_field(10), noise_field(15))
+    else:
+        arr = np.where(BRICK_MORTAR[..., None], add_noise(mortar_color, 10), add_noise(brick_color, 15))
     
-    img.save("assets/textures/brick.png")
-    print("brick.png (bonus)")
+    return [("assets/textures/brick.png", arr)]
 
 def generate_sand():
     """Genera textura de arena"""
-    size = 16
-    img = Image.new('RGB', (size, size))
-    pixels = img.load()
-    
-    base_color = (210, 180, 140)
-    
-    for y in range(size):
-        for x in range(size):
-            color = add_noise(base_color, 18)
-            
-            # Granos de arena más oscuros
-            if random.random() < 0.03:
-                color = tuple(max(0, c - 40) for c in color)
-            
-            pixels[x, y] = color
+    arr = add_noise((210, 180, 140), 18)
+    # Granos de arena más oscuros
+    shift(arr, RNG.random((16, 16)) < 0.03, -40)
     
-    img.save("assets/textures/sand.png")
-    print("sand.png (bonus)")
+    return [("assets/textures/sand.png", arr)]
+
+# Trabajos independientes: cada generador produce sus propias texturas
+JOBS = [
+    # Texturas básicas del Overworld
+    generate_grass_top,
+    generate_grass_side,
+    generate_dirt,
+    generate_stone,
+    generate_wood,
+    generate_leaves,
+    # Texturas animadas
+    generate_water_animated,
+    generate_lava_animated,
+    generate_portal_animated,
+    # Texturas del Nether
+    generate_netherrack,
+    generate_nether_brick,
+    generate_soul_sand,
+    generate_glowstone,
+    # Texturas de gemas/materiales especiales
+    generate_diamond,
+    generate_emerald,
+    generate_obsidian,
+    generate_ice,
+    # Texturas bonus
+    generate_brick,
+    generate_sand,
+]
 
 def main():
     """Genera todas las texturas"""
+    parser = argparse.ArgumentParser(description="Generador de texturas para el Ray Tracer")
+    parser.add_argument("--atlas", action="store_true",
+                        help="además de los PNG individuales, guarda assets/atlas.png + atlas.json "
+                             "(el programa Rust no usa el atlas)")
+    args = parser.parse_args()
+    
     print("=" * 60)
     print("GENERADOR DE TEXTURAS PARA RAY TRACER")
     print("=" * 60)
@@ -508,44 +368,24 @@ def main():
     ensure_directory()
     print("\nGenerando texturas 16x16...\n")
     
-    # Texturas básicas del Overworld
-    print("Texturas del Overworld:")
-    generate_grass_top()
-    generate_grass_side()
-    generate_dirt()
-    generate_stone()
-    generate_wood()
-    generate_leaves()
-    
-    # Texturas animadas
-    print("\nTexturas animadas:")
-    generate_water_animated()
-    generate_lava_animated()
-    generate_portal_animated()
+    # Cada generador devuelve una lista de (ruta, arreglo uint8)
+    textures = [texture for job in JOBS for texture in job()]
     
-    # Texturas del Nether
-    print("\nTexturas del Nether:")
-    generate_netherrack()
-    generate_nether_brick()
-    generate_soul_sand()
-    generate_glowstone()
+    # Los PNG individuales se escriben siempre: son los que carga el programa Rust
+    for path, arr in textures:
+        save_texture(arr, path)
+        print(os.path.basename(path))
     
-    # Texturas de gemas/materiales especiales
-    print("\nMateriales especiales:")
-    generate_diamond()
-    generate_emerald()
-    generate_obsidian()
-    generate_ice()
-    
-    # Texturas bonus
-    print("\nTexturas bonus:")
-    generate_brick()
-    generate_sand()
+    if args.atlas:
+        save_atlas(textures)
+        print("atlas.png + atlas.json")
     
     print("\n" + "=" * 60)
     print("¡Todas las texturas generadas exitosamente!")
     print(f"Ubicación: assets/textures/")
-    print(f"Total de archivos: 27 texturas")
+    if args.atlas:
+        print(f"Atlas: assets/atlas.png (manifiesto en assets/atlas.json)")
+    print(f"Total de texturas: {len(textures)}")
     print("\nTips:")
     print("   • Edita los PNG con cualquier editor de imágenes")
     print("   • Las texturas animadas tienen sufijos _0, _1, etc.")
@@ -557,11 +397,11 @@ if __name__ == "__main__":
         main()
     except ImportError:
         print("=" * 60)
-        print("ERROR: PIL (Pillow) no está instalado")
-        print("\nInstálalo con:")
-        print("   pip install pillow")
+        print("ERROR: PIL (Pillow) o NumPy no están instalados")
+        print("\nInstálalos con:")
+        print("   pip install pillow numpy")
         print("\n   o si usas pip3:")
-        print("   pip3 install pillow")
+        print("   pip3 install pillow numpy")
         print("=" * 60)
     except Exception as e:
         print(f"Error inesperado: {e}")
@@ -0,0 +1,41 @@
+"""
+Kernels compilados con Numba para las texturas 16x16
+Opcional: app.py solo los usa con TEXTURES_NUMBA=1; si no, usa la versión NumPy
+Requiere: pip install numba
+"""
+
+from numba import njit
+
+
+@njit(cache=True)
+def fill_noise(out, base, noise):
+    """Escribe color base + ruido (saturado a 0..255) en el buffer out"""
+    for y in range(out.shape[0]):
+        for x in range(out.shape[1]):
+            for c in range(3):
+                out[y, x, c] = min(255, max(0, base[c] + noise[y, x]))
+
+
+@njit(cache=True)
+def fill_select(out, mask, on, off, on_noise, off_noise):
+    """Elige por píxel entre dos colores con ruido según una máscara booleana"""
+    for y in range(out.shape[0]):
+        for x in range(out.shape[1]):
+            for c in range(3):
+                if mask[y, x]:
+                    v = on[c] + on_noise[y, x]
+                else:
+                    v = off[c] + off_noise[y, x]
+                out[y, x, c] = min(255, max(0, v))
+
+
+@njit(cache=True)
+def fill_water(out, base):
+    """Frames de agua: out tiene forma (frames, alto, ancho, 3)"""
+    for frame in range(out.shape[0]):
+        offset = frame * 2
+        for y in range(out.shape[1]):
+            for x in range(out.shape[2]):
+                wave = ((x + offset + y) % 4) * 8
+                for c in range(3):
+                    out[frame, y, x, c] = min(255, base[c] + wave)